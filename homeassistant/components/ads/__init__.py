@@ -1,6 +1,8 @@
 """Support for Automation Device Specification (ADS)."""
 
 import logging
+import re
+from types import MappingProxyType
 
 import pyads
 import voluptuous as vol
@@ -21,25 +23,27 @@ from .hub import AdsHub
 _LOGGER = logging.getLogger(__name__)
 
 
-ADS_TYPEMAP = {
-    AdsType.BOOL: pyads.PLCTYPE_BOOL,
-    AdsType.BYTE: pyads.PLCTYPE_BYTE,
-    AdsType.INT: pyads.PLCTYPE_INT,
-    AdsType.UINT: pyads.PLCTYPE_UINT,
-    AdsType.SINT: pyads.PLCTYPE_SINT,
-    AdsType.USINT: pyads.PLCTYPE_USINT,
-    AdsType.DINT: pyads.PLCTYPE_DINT,
-    AdsType.UDINT: pyads.PLCTYPE_UDINT,
-    AdsType.WORD: pyads.PLCTYPE_WORD,
-    AdsType.DWORD: pyads.PLCTYPE_DWORD,
-    AdsType.REAL: pyads.PLCTYPE_REAL,
-    AdsType.LREAL: pyads.PLCTYPE_LREAL,
-    AdsType.STRING: pyads.PLCTYPE_STRING,
-    AdsType.TIME: pyads.PLCTYPE_TIME,
-    AdsType.DATE: pyads.PLCTYPE_DATE,
-    AdsType.DATE_AND_TIME: pyads.PLCTYPE_DT,
-    AdsType.TOD: pyads.PLCTYPE_TOD,
-}
+ADS_TYPEMAP = MappingProxyType(
+    {
+        AdsType.BOOL: pyads.PLCTYPE_BOOL,
+        AdsType.BYTE: pyads.PLCTYPE_BYTE,
+        AdsType.INT: pyads.PLCTYPE_INT,
+        AdsType.UINT: pyads.PLCTYPE_UINT,
+        AdsType.SINT: pyads.PLCTYPE_SINT,
+        AdsType.USINT: pyads.PLCTYPE_USINT,
+        AdsType.DINT: pyads.PLCTYPE_DINT,
+        AdsType.UDINT: pyads.PLCTYPE_UDINT,
+        AdsType.WORD: pyads.PLCTYPE_WORD,
+        AdsType.DWORD: pyads.PLCTYPE_DWORD,
+        AdsType.REAL: pyads.PLCTYPE_REAL,
+        AdsType.LREAL: pyads.PLCTYPE_LREAL,
+        AdsType.STRING: pyads.PLCTYPE_STRING,
+        AdsType.TIME: pyads.PLCTYPE_TIME,
+        AdsType.DATE: pyads.PLCTYPE_DATE,
+        AdsType.DATE_AND_TIME: pyads.PLCTYPE_DT,
+        AdsType.TOD: pyads.PLCTYPE_TOD,
+    }
+)
 
 CONF_ADS_FACTOR = "factor"
 CONF_ADS_TYPE = "adstype"
@@ -48,11 +52,24 @@ CONF_ADS_VALUE = "value"
 
 SERVICE_WRITE_DATA_BY_NAME = "write_data_by_name"
 
+_AMS_NET_ID_RE = re.compile(
+    r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
+)
+
+
+def _ams_net_id(value: str) -> str:
+    """Validate an AMS net id (six octets, each 0-255)."""
+    match = _AMS_NET_ID_RE.match(value)
+    if match is None or any(int(octet) > 255 for octet in match.groups()):
+        raise vol.Invalid(f"invalid AMS net id: {value}")
+    return value
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.Schema(
             {
-                vol.Required(CONF_DEVICE): cv.string,
+                vol.Required(CONF_DEVICE): vol.All(cv.string, _ams_net_id),
                 vol.Required(CONF_PORT): cv.port,
                 vol.Optional(CONF_IP_ADDRESS): cv.string,
             }
@@ -95,6 +112,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DATA_ADS] = ads
     hass.bus.listen(EVENT_HOMEASSISTANT_STOP, ads.shutdown)
 
+    # Bound once so the service handler avoids the attribute lookup per call
+    typemap_get = ADS_TYPEMAP.__getitem__
+
     def handle_write_data_by_name(call: ServiceCall) -> None:
         """Write a value to the connected ADS device."""
         ads_var: str = call.data[CONF_ADS_VAR]
@@ -102,7 +122,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         value: int = call.data[CONF_ADS_VALUE]
 
         try:
-            ads.write_by_name(ads_var, value, ADS_TYPEMAP[ads_type])
+            ads.write_by_name(ads_var, value, typemap_get(ads_type))
         except pyads.ADSError as err:
             _LOGGER.error(err)
 
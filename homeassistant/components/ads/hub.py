@@ -1,6 +1,5 @@
 """Support for Automation Device Specification (ADS)."""
 
-from collections import namedtuple
 import ctypes
 import logging
 import struct
@@ -10,10 +9,71 @@ import pyads
 
 _LOGGER = logging.getLogger(__name__)
 
-# Tuple to hold data needed for notification
-NotificationItem = namedtuple(  # noqa: PYI024
-    "NotificationItem", "hnotify huser name plc_datatype callback"
-)
+
+class NotificationItem:
+    """Hold the data needed for a device notification."""
+
+    __slots__ = ("callback", "decoder", "hnotify", "huser", "name", "plc_datatype")
+
+    def __init__(self, hnotify, huser, name, plc_datatype, callback, decoder):
+        """Initialize the notification item."""
+        self.hnotify = hnotify
+        self.huser = huser
+        self.name = name
+        self.plc_datatype = plc_datatype
+        self.callback = callback
+        self.decoder = decoder
+
+
+# Pre-compiled structs for scalar PLC datatypes; TIME, DATE, DT and TOD
+# are transmitted as DINT
+_UNPACKERS = {
+    pyads.PLCTYPE_BYTE: struct.Struct("<b"),
+    pyads.PLCTYPE_INT: struct.Struct("<h"),
+    pyads.PLCTYPE_UINT: struct.Struct("<H"),
+    pyads.PLCTYPE_SINT: struct.Struct("<b"),
+    pyads.PLCTYPE_USINT: struct.Struct("<B"),
+    pyads.PLCTYPE_DINT: struct.Struct("<i"),
+    pyads.PLCTYPE_UDINT: struct.Struct("<I"),
+    pyads.PLCTYPE_WORD: struct.Struct("<H"),
+    pyads.PLCTYPE_DWORD: struct.Struct("<I"),
+    pyads.PLCTYPE_LREAL: struct.Struct("<d"),
+    pyads.PLCTYPE_REAL: struct.Struct("<f"),
+    pyads.PLCTYPE_TOD: struct.Struct("<i"),
+    pyads.PLCTYPE_DATE: struct.Struct("<i"),
+    pyads.PLCTYPE_DT: struct.Struct("<i"),
+    pyads.PLCTYPE_TIME: struct.Struct("<i"),
+}
+
+_BOOL_STRUCT = struct.Struct("<?")
+
+# Offset of the sample data within the notification header, fixed at runtime
+_NOTIF_HEADER_DATA_OFFSET = pyads.structs.SAdsNotificationHeader.data.offset
+
+# Notification attributes per PLC datatype; pyads treats them as input-only
+_NATTR_CACHE: dict[type, pyads.NotificationAttrib] = {}
+
+
+def _decode_bool(data):
+    """Decode raw notification data as a boolean."""
+    return bool(_BOOL_STRUCT.unpack_from(data)[0])
+
+
+def _decode_string(data):
+    """Decode raw notification data as a NUL-terminated string."""
+    nul = data.find(b"\x00")
+    return (data if nul < 0 else data[:nul]).decode("utf-8", errors="ignore")
+
+
+def _decoder_for(plc_datatype):
+    """Return a decoder for raw notification data of the given datatype."""
+    if plc_datatype == pyads.PLCTYPE_BOOL:
+        return _decode_bool
+    if plc_datatype == pyads.PLCTYPE_STRING:
+        return _decode_string
+    if (unpacker := _UNPACKERS.get(plc_datatype)) is not None:
+        return lambda data, unpack_from=unpacker.unpack_from: unpack_from(data)[0]
+    return None
 
 
 class AdsHub:
@@ -25,15 +85,21 @@ class AdsHub:
         self._client.open()
 
         # All ADS devices are registered here
-        self._devices = []
+        self._devices = set()
         self._notification_items = {}
-        self._lock = threading.Lock()
+        # Serializes read/write requests on the pyads client
+        self._client_lock = threading.Lock()
+        # Guards mutation of the notification item map
+        self._notifs_lock = threading.Lock()
 
     def shutdown(self, *args, **kwargs):
         """Shutdown ADS connection."""
 
         _LOGGER.debug("Shutting down ADS")
-        for notification_item in self._notification_items.values():
+        with self._notifs_lock:
+            notification_items = list(self._notification_items.values())
+            self._notification_items.clear()
+        for notification_item in notification_items:
             _LOGGER.debug(
                 "Deleting device notification %d, %d",
                 notification_item.hnotify,
@@ -52,12 +118,12 @@ class AdsHub:
 
     def register_device(self, device):
         """Register a new device."""
-        self._devices.append(device)
+        self._devices.add(device)
 
     def write_by_name(self, name, value, plc_datatype):
         """Write a value to the device."""
 
-        with self._lock:
+        with self._client_lock:
             try:
                 return self._client.write_by_name(name, value, plc_datatype)
             except pyads.ADSError as err:
@@ -66,7 +132,7 @@ class AdsHub:
     def read_by_name(self, name, plc_datatype):
         """Read a value from the device."""
 
-        with self._lock:
+        with self._client_lock:
             try:
                 return self._client.read_by_name(name, plc_datatype)
             except pyads.ADSError as err:
@@ -75,75 +141,49 @@ class AdsHub:
     def add_device_notification(self, name, plc_datatype, callback):
         """Add a notification to the ADS devices."""
 
-        attr = pyads.NotificationAttrib(ctypes.sizeof(plc_datatype))
+        if (attr := _NATTR_CACHE.get(plc_datatype)) is None:
+            attr = _NATTR_CACHE.setdefault(
+                plc_datatype, pyads.NotificationAttrib(ctypes.sizeof(plc_datatype))
+            )
 
-        with self._lock:
-            try:
-                hnotify, huser = self._client.add_device_notification(
-                    name, attr, self._device_notification_callback
-                )
-            except pyads.ADSError as err:
-                _LOGGER.error("Error subscribing to %s: %s", name, err)
-            else:
-                hnotify = int(hnotify)
-                self._notification_items[hnotify] = NotificationItem(
-                    hnotify, huser, name, plc_datatype, callback
-                )
+        # Issue the blocking subscription call outside the lock so setting up
+        # one notification does not stall callbacks or other subscriptions
+        try:
+            hnotify, huser = self._client.add_device_notification(
+                name, attr, self._device_notification_callback
+            )
+        except pyads.ADSError as err:
+            _LOGGER.error("Error subscribing to %s: %s", name, err)
+            return
 
-                _LOGGER.debug(
-                    "Added device notification %d for variable %s", hnotify, name
-                )
+        hnotify = int(hnotify)
+        with self._notifs_lock:
+            self._notification_items[hnotify] = NotificationItem(
+                hnotify, huser, name, plc_datatype, callback, _decoder_for(plc_datatype)
+            )
+
+        _LOGGER.debug("Added device notification %d for variable %s", hnotify, name)
 
     def _device_notification_callback(self, notification, name):
         """Handle device notifications."""
         contents = notification.contents
         hnotify = int(contents.hNotification)
-        _LOGGER.debug("Received notification %d", hnotify)
 
-        # Get dynamically sized data array
+        # Get the dynamically sized sample data
         data_size = contents.cbSampleSize
-        data_address = (
-            ctypes.addressof(contents)
-            + pyads.structs.SAdsNotificationHeader.data.offset
-        )
-        data = (ctypes.c_ubyte * data_size).from_address(data_address)
+        data_address = ctypes.addressof(contents) + _NOTIF_HEADER_DATA_OFFSET
+        data = ctypes.string_at(data_address, data_size)
 
-        # Acquire notification item
-        with self._lock:
-            notification_item = self._notification_items.get(hnotify)
+        # Reading the dict is atomic under the GIL, no lock needed
+        notification_item = self._notification_items.get(hnotify)
 
         if not notification_item:
             _LOGGER.error("Unknown device notification handle: %d", hnotify)
             return
 
-        # Data parsing based on PLC data type
-        plc_datatype = notification_item.plc_datatype
-        unpack_formats = {
-            pyads.PLCTYPE_BYTE: "<b",
-            pyads.PLCTYPE_INT: "<h",
-            pyads.PLCTYPE_UINT: "<H",
-            pyads.PLCTYPE_SINT: "<b",
-            pyads.PLCTYPE_USINT: "<B",
-            pyads.PLCTYPE_DINT: "<i",
-            pyads.PLCTYPE_UDINT: "<I",
-            pyads.PLCTYPE_WORD: "<H",
-            pyads.PLCTYPE_DWORD: "<I",
-            pyads.PLCTYPE_LREAL: "<d",
-            pyads.PLCTYPE_REAL: "<f",
-            pyads.PLCTYPE_TOD: "<i",  # Treat as DINT
-            pyads.PLCTYPE_DATE: "<i",  # Treat as DINT
-            pyads.PLCTYPE_DT: "<i",  # Treat as DINT
-            pyads.PLCTYPE_TIME: "<i",  # Treat as DINT
-        }
-
-        if plc_datatype == pyads.PLCTYPE_BOOL:
-            value = bool(struct.unpack("<?", bytearray(data))[0])
-        elif plc_datatype == pyads.PLCTYPE_STRING:
-            value = (
-                bytearray(data).split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
-            )
-        elif plc_datatype in unpack_formats:
-            value = struct.unpack(unpack_formats[plc_datatype], bytearray(data))[0]
+        # Data parsing based on the decoder bound at subscription time
+        if (decoder := notification_item.decoder) is not None:
+            value = decoder(data)
         else:
             value = bytearray(data)
             _LOGGER.warning("No callback available for this datatype")
@@ -26,28 +26,30 @@ from .hub import AdsHub
 
 DEFAULT_NAME = "ADS sensor"
 
+_SENSOR_ADS_TYPES = frozenset(
+    {
+        AdsType.BOOL,
+        AdsType.BYTE,
+        AdsType.INT,
+        AdsType.UINT,
+        AdsType.SINT,
+        AdsType.USINT,
+        AdsType.DINT,
+        AdsType.UDINT,
+        AdsType.WORD,
+        AdsType.DWORD,
+        AdsType.LREAL,
+        AdsType.REAL,
+    }
+)
+
 PLATFORM_SCHEMA = SENSOR_PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ADS_VAR): cv.string,
         vol.Optional(CONF_ADS_FACTOR): cv.positive_int,
         vol.Optional(CONF_ADS_TYPE, default=AdsType.INT): vol.All(
             vol.Coerce(AdsType),
-            vol.In(
-                [
-                    AdsType.BOOL,
-                    AdsType.BYTE,
-                    AdsType.INT,
-                    AdsType.UINT,
-                    AdsType.SINT,
-                    AdsType.USINT,
-                    AdsType.DINT,
-                    AdsType.UDINT,
-                    AdsType.WORD,
-                    AdsType.DWORD,
-                    AdsType.LREAL,
-                    AdsType.REAL,
-                ]
-            ),
+            vol.In(_SENSOR_ADS_TYPES),
         ),
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
         vol.Optional(CONF_DEVICE_CLASS): SENSOR_DEVICE_CLASSES_SCHEMA,